@@ -2,202 +2,14 @@
 """
 vnf_backup_crd_controller.py
 
-VNF Cluster Backup and Restore Controller using VnfBackup CRD.
-All operations are log-only. Includes realistic progress bars and CRD YAML output.
+VNF Cluster Backup and Restore Controller using VnfBackup CRD, one CR per VM
+with CRD YAML output. Kept for existing invocations; the controller lives in
+the vnfctl package. Equivalent to: python3 -m vnfctl run --per-vm-crs
 """
 
-import datetime, time, random
-from tqdm import tqdm
-from typing import List, Dict
+import sys
 
-# ------------------ Utility Functions ------------------
-
-def now_ts():
-    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-
-def log(msg: str):
-    print(f"[{now_ts()}] {msg}")
-
-def progress_bar(label: str, duration_sec: float):
-    steps = 100  # 100% granularity
-    for i in tqdm(range(steps), desc=label, ncols=80, bar_format="{l_bar}{bar} | {percentage:3.0f}%"):
-        time.sleep(duration_sec / steps)
-
-# ------------------ Cluster Data ------------------
-
-RTRV_OUTPUT = [
-    ("vnf-node-01", "ACTIVE"),
-    ("vnf-node-02", "ACTIVE"),
-    ("vnf-node-03", "STANDBY"),
-    ("vnf-node-04", "STANDBY"),
-    ("vnf-node-05", "ACTIVE"),
-]
-
-NODE_VMS_LIST = {
-    "vnf-node-01": ["vnf-a", "vnf-b"],
-    "vnf-node-02": ["vnf-c"],
-    "vnf-node-03": ["vnf-d"],
-    "vnf-node-04": ["vnf-e", "vnf-f"],
-    "vnf-node-05": ["vnf-g"]
-}
-
-VM_SIZE_LIST = {
-    "vnf-a": 1200,
-    "vnf-b": 800,
-    "vnf-c": 600,
-    "vnf-d": 400,
-    "vnf-e": 200,
-    "vnf-f": 300,
-    "vnf-g": 900
-}
-
-# ------------------ Global Node Lists ------------------
-ACTIVE_NODES: List[str] = []
-STANDBY_NODES: List[str] = []
-
-# ------------------ CRD Simulation ------------------
-
-def create_vnfbackup_cr(name: str, target: str, vm_name: str):
-    log(f"Creating VnfBackup CR: name={name} target={target}")
-    time.sleep(0.3)
-    log(f"VnfBackup/{name} created. status=Pending")
-    return {"name": name, "target": target, "vm_name": vm_name, "status": "Pending"}
-
-def update_cr_status(cr: Dict, status: str):
-    cr['status'] = status
-    log(f"VnfBackup/{cr['name']} status={status}")
-
-def kubectl_get_vnfbackup_yaml(cr: Dict):
-    yaml_output = f"""apiVersion: kubevirt.io/v1alpha1
-kind: VNFBackup
-metadata:
-  name: {cr['name']}
-  namespace: default
-  creationTimestamp: "{now_ts()}"
-spec:
-  status: {cr['status']}
-  storageLocation: external-storage://backups/{cr['vm_name']}
-  vmName: {cr['vm_name']}
-"""
-    print(yaml_output)
-
-# ------------------ Backup Functions ------------------
-
-def backup_vm(cr: Dict, size_mb: int):
-    log(f"START backup of VM: {cr['vm_name']} | PV size: {size_mb}MB | target: external-storage://backups/{cr['vm_name']}")
-    duration = max(1, size_mb // 50)
-    progress_bar(f"Backing up {cr['vm_name']}", duration)
-    log(f"COMPLETE backup of VM: {cr['vm_name']} | stored at external-storage://backups/{cr['vm_name']}")
-    update_cr_status(cr, "Completed")
-    kubectl_get_vnfbackup_yaml(cr)
-
-def backup_db(db_name: str):
-    log(f"Starting MariaDB backup: {db_name}")
-    progress_bar(f"DB Backup {db_name}", 2)
-    log(f"Database backup complete: {db_name}")
-
-def backup_volume(pvc: str):
-    log(f"Backing up volume: {pvc} using CSI snapshot")
-    progress_bar(f"Volume Backup {pvc}", 2)
-    log(f"Volume backup complete: {pvc}")
-
-def backup_file(pod: str, path_includes: List[str], path_excludes: List[str]):
-    log(f"Backing up files from pod: {pod}")
-    for p in path_includes:
-        progress_bar(f"File Backup {pod}:{p}", 1)
-    log(f"Excluding paths: {', '.join(path_excludes)}")
-    log(f"File backup complete for pod: {pod}")
-
-# ------------------ Controller Phases ------------------
-
-def pre_checks():
-    global ACTIVE_NODES, STANDBY_NODES
-    log("PHASE: Pre-checks")
-    log("Verifying backup packages: BKUP.PKG, CRTE-FW.PKG")
-    time.sleep(0.3)
-    log("BKUP.PKG: available")
-    log("CRTE-FW.PKG: available")
-    log("Running RTRV-NODE-STS to gather VNF node status")
-    for node, state in RTRV_OUTPUT:
-        log(f"RTRV-NODE-STS > {node} {state}")
-        if state == "ACTIVE": ACTIVE_NODES.append(node)
-        else: STANDBY_NODES.append(node)
-    log(f"ACTIVE nodes: {ACTIVE_NODES}")
-    log(f"STANDBY nodes: {STANDBY_NODES}\n")
-
-def backup_nodes(nodes: List[str], prefix: str):
-    for node in nodes:
-        vms = NODE_VMS_LIST.get(node, [])
-        for vm in vms:
-            cr_name = f"{prefix}-{vm}-{int(time.time())}"
-            cr = create_vnfbackup_cr(cr_name, f"node:{node}", vm)
-            update_cr_status(cr, "InProgress")
-            backup_vm(cr, VM_SIZE_LIST.get(vm, 300))
-            # For simulation, include DB backup if node has DB
-            db_name = f"{vm}-db"
-            backup_db(db_name)
-
-def switchover():
-    global ACTIVE_NODES, STANDBY_NODES
-    log("PHASE: Fast Failover / Switchover")
-    log("Initiating fast failover (FFO). Standby nodes promoted to active.")
-    time.sleep(1)
-    ACTIVE_NODES, STANDBY_NODES = STANDBY_NODES, ACTIVE_NODES
-    log(f"New ACTIVE nodes: {ACTIVE_NODES}")
-    log(f"New STANDBY nodes: {STANDBY_NODES}\n")
-
-def post_checks_and_restore():
-    log("PHASE: Post-checks and restore")
-    down_host = None
-    if random.randint(0,3) == 0:
-        down_host = ACTIVE_NODES[0]
-        log(f"ALERT: Detected compute host down: {down_host}")
-        log(f"Operator action: Re-installing platform on {down_host}")
-        time.sleep(2)
-        log(f"Platform re-installation complete on {down_host}")
-        for vm in NODE_VMS_LIST.get(down_host, []):
-            log(f"Restoring VM {vm} to {down_host} from external-storage://backups/{vm}")
-            progress_bar(f"Restoring {vm}", 3)
-            log(f"VM restore complete: {vm}")
-    else:
-        log("All compute hosts healthy")
-    
-    crname = f"restore-system-{int(time.time())}"
-    cr = create_vnfbackup_cr(crname, "system:restore", "all-vms")
-    update_cr_status(cr, "InProgress")
-    progress_bar("CRD system restore", 3)
-    update_cr_status(cr, "Completed")
-    kubectl_get_vnfbackup_yaml(cr)
-    log("Restoring packages: BKUP.PKG, CRTE-FW.PKG")
-    time.sleep(1)
-    log("Packages restored successfully")
-    progress_bar("Post-sync IDs across cloud DBs", 3)
-    log("Post-sync complete")
-
-def final_summary():
-    log("PHASE: Summary")
-    print("\n+------------------------------+")
-    print("| Backup and Restore Summary   |")
-    print("+------------------------------+")
-    print(f"Total nodes evaluated : {len(RTRV_OUTPUT)}")
-    print(f"Active nodes now      : {ACTIVE_NODES}")
-    print(f"Standby nodes now     : {STANDBY_NODES}")
-    print(f"Backups stored at     : external-storage://backups/")
-    print(f"Key packages          : BKUP.PKG, CRTE-FW.PKG")
-    print(f"Checks performed      : RTRV-NODE-STS, VnfBackup CRD create/monitor, VM backup, DB backup, package restore, ID sync")
-    print("+------------------------------+\n")
-    log("Backup and restore operation completed.")
-
-# ------------------ Main Flow ------------------
-
-def main():
-    log("Starting VNF Cluster backup and restore using VnfBackup CRD\n")
-    pre_checks()
-    backup_nodes(STANDBY_NODES, "backup-standby")
-    switchover()
-    backup_nodes(STANDBY_NODES, "backup-prevactive")
-    post_checks_and_restore()
-    final_summary()
+from vnfctl.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(["run", "--per-vm-crs"] + sys.argv[1:]))
@@ -10,12 +10,17 @@ Features
 - For each VIM, generate a simulated VNFBackup custom resource YAML (printed) and "apply" it.
 - Simulate controller behavior: update a status condition named "backup-vm1" for all CRs and print logs.
 - Print a summary ASCII table at the end.
+- Optionally shard VIMs across local worker processes (--workers N). VIMs map to shards by
+  consistent hashing; results stream back to the coordinator and are merged into one summary.
+  A worker that crashes or goes --vim-timeout seconds without a result only has its own
+  shard re-run (up to --max-retries times).
 
 Usage examples
 - python3 vnf_backup_sim.py --crd-file my-crd.yaml
 - python3 vnf_backup_sim.py --vims vim-a,vim-b
 - python3 vnf_backup_sim.py --crd-file my-crd.yaml --controller
 - python3 vnf_backup_sim.py            # uses embedded CRD and two default VIMs
+- python3 vnf_backup_sim.py --vims vim-a,vim-b,vim-c,vim-d --workers 4 --controller
 
 Notes
 - This is a simulator. It only prints logs and YAML text. No network or kubectl operations are performed.
@@ -24,9 +29,14 @@ Notes
 
 import sys
 import argparse
+import bisect
 import datetime
+import hashlib
 import json
+import multiprocessing
 import textwrap
+import time
+from multiprocessing.connection import wait
 from typing import List, Dict, Any, Optional
 
 # --------- Embedded CRD (the one you supplied) ----------
@@ -87,7 +97,7 @@ def now_ts() -> str:
     return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
 
 def log(msg: str):
-    print(f"[{now_ts()}] {msg}")
+    sys.stdout.write(f"[{now_ts()}] {msg}\n")
 
 def ascii_table(rows: List[List[str]], headers: List[str]) -> str:
     # simple fixed-width ascii table
@@ -152,6 +162,8 @@ class VNFBackupSimulator:
         self.simulate_steps = simulate_steps
         self.vims = vims or self._discover_vims() or ["vim-default-1","vim-default-2"]
         self.created_backups: List[Dict[str, Any]] = []
+        self.failed_vims: List[str] = []
+        self.echo_yaml = True  # shard workers leave the YAML to the coordinator
 
     def _discover_vims(self) -> List[str]:
         # try to find spec.vims or metadata.vims in CRD; fallback to empty
@@ -199,12 +211,14 @@ class VNFBackupSimulator:
         }
         return backup_cr
 
+    def print_cr_yaml(self, cr: Dict[str, Any]):
+        sys.stdout.write(f"--- YAML START ---\n{json.dumps(cr, indent=2)}\n--- YAML END ---\n")
+        sys.stdout.flush()
+
     def simulate_kubectl_apply(self, cr: Dict[str, Any]):
-        yaml_text = json.dumps(cr, indent=2)
         log(f"Simulating: kubectl apply -f -  # resource: {cr['kind']}/{cr['metadata']['name']}")
-        print("--- YAML START ---")
-        print(yaml_text)
-        print("--- YAML END ---")
+        if self.echo_yaml:
+            self.print_cr_yaml(cr)
         log(f"Applied simulated resource {cr['kind']}/{cr['metadata']['name']} in namespace {cr['metadata']['namespace']}")
 
     def run_backup_steps(self, cr: Dict[str, Any]):
@@ -225,9 +239,7 @@ class VNFBackupSimulator:
         for step_id, desc in steps:
             log(f"[{cr['metadata']['name']}] Step {step_id} - {desc} ...")
             # print a small fake progress bar using dots
-            for i in range(3):
-                print(".", end="", flush=True)
-            print("")  # newline
+            sys.stdout.write("." * 3 + "\n")
         log(f"Completed simulated backup workflow for {cr['metadata']['name']}")
 
     def controller_update_backup_vm1(self):
@@ -246,7 +258,7 @@ class VNFBackupSimulator:
             log(f"Controller: updated status.backup-vm1 for {cr['metadata']['name']} -> True")
 
     def summarize(self):
-        rows = []
+        by_vim = {}
         for cr in self.created_backups:
             name = cr['metadata']['name']
             vim = cr['metadata']['labels'].get('vim', '')
@@ -254,24 +266,140 @@ class VNFBackupSimulator:
             conds = cr.get("status", {}).get("conditions", [])
             vm1 = next((c for c in conds if c.get("type")=="backup-vm1"), None)
             status = vm1.get("status") if vm1 else "Pending"
-            rows.append([vim, name, status])
+            by_vim[vim] = [vim, name, status]
+        for vim in self.failed_vims:
+            by_vim[vim] = [vim, "-", "FAILED"]
+        rows = [by_vim[v] for v in self.vims if v in by_vim]
         log("Summary of simulated backup instances:")
         print(ascii_table(rows, ["VIM", "BackupCR", "backup-vm1"]))
 
+    def process_vim(self, vim: str) -> Dict[str, Any]:
+        log(f"Creating simulated backup instance for VIM '{vim}'")
+        cr = self.create_backup_cr_for_vim(vim)
+        self.simulate_kubectl_apply(cr)
+        if self.simulate_steps:
+            self.run_backup_steps(cr)
+        return cr
+
     def run(self):
         log("Starting VNF Backup Simulator")
         for vim in self.vims:
-            log(f"Creating simulated backup instance for VIM '{vim}'")
-            cr = self.create_backup_cr_for_vim(vim)
-            self.simulate_kubectl_apply(cr)
-            self.created_backups.append(cr)
-            if self.simulate_steps:
-                self.run_backup_steps(cr)
+            self.created_backups.append(self.process_vim(vim))
         if self.controller_mode:
             log("Running simulated controller updates")
             self.controller_update_backup_vm1()
         self.summarize()
         log("Simulator run complete")
+        return 0
+
+
+# --------- Sharded execution ----------
+def shard_vims(vims: List[str], shards: int, replicas: int = 64) -> List[List[str]]:
+    """Assign VIMs to shards with a consistent-hash ring (stable when the shard count changes)."""
+    def h(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode()).digest()[:8], "big")
+    ring = sorted((h(f"shard-{s}#{r}"), s) for s in range(shards) for r in range(replicas))
+    points = [p for p, _ in ring]
+    out: List[List[str]] = [[] for _ in range(shards)]
+    for vim in vims:
+        i = bisect.bisect(points, h(vim)) % len(ring)
+        out[ring[i][1]].append(vim)
+    return out
+
+def _shard_worker(crd_text: str, vims: List[str], simulate_steps: bool, conn):
+    sys.stdout.reconfigure(line_buffering=True)
+    sim = VNFBackupSimulator(crd_text=crd_text, vims=vims, simulate_steps=simulate_steps)
+    sim.echo_yaml = False
+    for vim in vims:
+        conn.send(("cr", vim, sim.process_vim(vim)))
+    conn.send(("done", None, None))
+    conn.close()
+
+class ShardedSimulator(VNFBackupSimulator):
+    """Coordinator: runs the create/apply/steps pipeline for each shard in its own process.
+
+    Every shard attempt gets its own pipe, so a worker dying mid-send cannot block the
+    others, and a deadline that moves forward with every result (vim_timeout seconds per
+    VIM), so a hung worker is killed and re-run while a long, healthy shard is not.
+    """
+
+    def __init__(self, *args, workers: int = 2, max_retries: int = 2, vim_timeout: float = 600.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workers = max(1, workers)
+        self.max_retries = max_retries
+        self.vim_timeout = vim_timeout
+
+    def _start(self, shard_id: int, attempt: int, vims: List[str]):
+        recv, send = multiprocessing.Pipe(duplex=False)
+        proc = multiprocessing.Process(target=_shard_worker, name=f"vnf-shard-{shard_id}-{attempt}",
+                                       args=(self.raw_crd_text, vims, self.simulate_steps, send))
+        proc.start()
+        send.close()  # the worker holds the only write end: EOF means it exited
+        return proc, recv, time.monotonic() + self.vim_timeout
+
+    def run(self):
+        log(f"Starting VNF Backup Simulator (sharded across {self.workers} worker processes)")
+        shards = shard_vims(self.vims, self.workers)
+        for shard_id, vims in enumerate(shards):
+            log(f"Shard {shard_id}: {', '.join(vims) or '(empty)'}")
+        running = {s: self._start(s, 0, v) for s, v in enumerate(shards) if v}
+        partial: Dict[int, Dict[str, Dict[str, Any]]] = {s: {} for s in running}
+        merged: Dict[str, Dict[str, Any]] = {}
+        retries = {s: 0 for s in running}
+        self.failed_vims = []
+
+        def rerun(s: int, reason: str):
+            # drop the shard's partial results and re-run only this shard
+            proc, conn, _ = running.pop(s)
+            proc.join()
+            conn.close()
+            partial[s] = {}
+            if retries[s] >= self.max_retries:
+                log(f"Coordinator: shard {s} failed ({reason}) {retries[s] + 1} times; giving up on {', '.join(shards[s])}")
+                self.failed_vims.extend(shards[s])
+                return
+            retries[s] += 1
+            log(f"Coordinator: shard {s} failed ({reason}); re-running it (attempt {retries[s] + 1})")
+            running[s] = self._start(s, retries[s], shards[s])
+
+        while running:
+            conns = {conn: s for s, (_, conn, _) in running.items()}
+            for conn in wait(list(conns), timeout=0.5):
+                s = conns[conn]
+                try:
+                    kind, vim, cr = conn.recv()
+                except (EOFError, OSError):
+                    proc = running[s][0]
+                    proc.join()
+                    rerun(s, f"exit {proc.exitcode}")
+                    continue
+                if kind == "cr":
+                    proc, conn, _ = running[s]
+                    running[s] = (proc, conn, time.monotonic() + self.vim_timeout)
+                    partial[s][vim] = cr
+                    log(f"Coordinator: received {cr['metadata']['name']} from shard {s}")
+                elif kind == "done":
+                    proc, conn, _ = running.pop(s)
+                    proc.join()
+                    conn.close()
+                    for vim in shards[s]:
+                        self.print_cr_yaml(partial[s][vim])
+                    merged.update(partial.pop(s))
+            now = time.monotonic()
+            for s, (proc, _, deadline) in list(running.items()):
+                if now >= deadline:
+                    proc.kill()
+                    rerun(s, f"no result within {self.vim_timeout:g}s")
+        self.created_backups = [merged[v] for v in self.vims if v in merged]
+        if self.controller_mode:
+            log("Running simulated controller updates")
+            self.controller_update_backup_vm1()
+        self.summarize()
+        if self.failed_vims:
+            log(f"Simulator run finished with {len(self.failed_vims)} failed VIM(s): {', '.join(self.failed_vims)}")
+            return 1
+        log("Simulator run complete")
+        return 0
 
 
 # --------- CLI ----------
@@ -283,7 +411,17 @@ def parse_args():
     p.add_argument("--vims", help="Comma-separated list of VIM names to simulate. Overrides CRD vims if present.")
     p.add_argument("--no-steps", dest="steps", action="store_false", help="Do not simulate backup workflow steps.")
     p.add_argument("--controller", action="store_true", help="Simulate controller updates (status backup-vm1 updates).")
-    return p.parse_args()
+    p.add_argument("--workers", type=int, default=1, help="Shard VIMs across this many worker processes (default: 1, in-process).")
+    p.add_argument("--vim-timeout", type=float, default=600.0,
+                   help="With --workers: seconds a shard may go without finishing a VIM before it is killed and re-run (default: 600).")
+    p.add_argument("--max-retries", type=int, default=2,
+                   help="With --workers: times a failed shard is re-run before its VIMs are reported FAILED (default: 2).")
+    args = p.parse_args()
+    if args.vim_timeout <= 0:
+        p.error("--vim-timeout must be > 0")
+    if args.max_retries < 0:
+        p.error("--max-retries must be >= 0")
+    return args
 
 def main():
     args = parse_args()
@@ -301,8 +439,13 @@ def main():
     if args.vims:
         vims = [x.strip() for x in args.vims.split(",") if x.strip()]
 
-    sim = VNFBackupSimulator(crd_text=crd_text, vims=vims, controller_mode=args.controller, simulate_steps=args.steps)
-    sim.run()
+    if args.workers > 1:
+        sim = ShardedSimulator(crd_text=crd_text, vims=vims, controller_mode=args.controller,
+                               simulate_steps=args.steps, workers=args.workers,
+                               vim_timeout=args.vim_timeout, max_retries=args.max_retries)
+    else:
+        sim = VNFBackupSimulator(crd_text=crd_text, vims=vims, controller_mode=args.controller, simulate_steps=args.steps)
+    sys.exit(sim.run())
 
 if __name__ == "__main__":
     main()
@@ -3,113 +3,13 @@
 vnf_backup_crd_controller.py
 
 VNF Cluster Backup and Restore Controller using VnfBackup CRD.
-All operations are log-only. Includes progress bars and realistic workflow.
+Kept for existing invocations; the controller lives in the vnfctl package.
+Equivalent to: python3 -m vnfctl run
 """
 
-import sys, time, random, datetime
-from typing import List, Dict
-from tqdm import tqdm
-
-# ------------------ Utility functions ------------------
-
-def now_ts(): return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
-
-def log(msg: str):
-    print(f"[{now_ts()}] {msg}")
-
-def progress_bar(label: str, duration: int):
-    for _ in tqdm(range(duration), desc=label, bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}s", ncols=80):
-        time.sleep(1)
-
-# ------------------ Cluster & VM Data ------------------
-
-RTRV_OUTPUT = [
-    ("vnf-node-01", "ACTIVE"),
-    ("vnf-node-02", "ACTIVE"),
-    ("vnf-node-03", "STANDBY"),
-    ("vnf-node-04", "STANDBY"),
-    ("vnf-node-05", "ACTIVE"),
-]
-
-NODE_VMS_LIST = {
-    "vnf-node-01": ["vnf-a", "vnf-b"],
-    "vnf-node-02": ["vnf-c"],
-    "vnf-node-03": ["vnf-d"],
-    "vnf-node-04": ["vnf-e", "vnf-f"],
-    "vnf-node-05": ["vnf-g"]
-}
-
-VM_SIZE_LIST = {
-    "vnf-a": 1200,
-    "vnf-b": 800,
-    "vnf-c": 600,
-    "vnf-d": 400,
-    "vnf-e": 200,
-    "vnf-f": 300,
-    "vnf-g": 900
-}
-
-# ------------------ CRD Helpers ------------------
-
-def create_vnfbackup_cr(name: str, target: str):
-    log(f"Creating VnfBackup CR: name={name} target={target}")
-    time.sleep(0.5)
-    log(f"VnfBackup/{name} created. status=Pending")
-
-def monitor_cr_status(name: str):
-    log(f"Monitoring VnfBackup/{name} status")
-    time.sleep(0.5)
-    log(f"VnfBackup/{name} status=InProgress")
-    progress_bar(f"CRD:{name} backup progress", 3)
-    time.sleep(0.3)
-    log(f"VnfBackup/{name} status=Completed")
-
-def backup_vm(vm: str, size_mb: int):
-    log(f"START backup of VM: {vm} | PV size: {size_mb}MB | target: external-storage://backups/{vm}.tgz")
-    duration = (size_mb // 50) + 2
-    progress_bar(f"Backing up {vm}", duration)
-    log(f"COMPLETE backup of VM: {vm} | stored at external-storage://backups/{vm}.tgz")
-
-def restore_pkg(pkg: str):
-    log(f"Restoring package: {pkg}")
-    time.sleep(1)
-    log(f"Restore complete: {pkg}")
-
-# ------------------ Controller Phases ------------------
-
-ACTIVE_NODES, STANDBY_NODES = [], []
-
-def pre_checks():
-    global ACTIVE_NODES, STANDBY_NODES
-    log("PHASE: Pre-checks")
-    log("Verifying backup packages: BKUP.PKG, CRTE-FW.PKG")
-    time.sleep(0.5)
-    log("BKUP.PKG: available")
-    log("CRTE-FW.PKG: available")
-    time.sleep(0.3)
-    
-    log("Running RTRV-NODE-STS to gather VNF node status")
-    for node, state in RTRV_OUTPUT:
-        log(f"RTRV-NODE-STS > {node} {state}")
-        if state == "ACTIVE": ACTIVE_NODES.append(node)
-        else: STANDBY_NODES.append(node)
-    
-    log("Grouped nodes:")
-    print(f"\n{'NODE':<15} | {'ROLE':<10}")
-    print(f"{'-'*15}-+-{'-'*10}")
-    for node, state in RTRV_OUTPUT:
-        print(f"{node:<15} | {state:<10}")
-    print("")
-    
-    log("Checking for VnfBackup CRD presence")
-    time.sleep(0.5)
-    log("CRD vnfbackups.mydomain/v1: present\n")
-
-def backup_standby_nodes():
-    log("PHASE: Backup standby VMs via VnfBackup CRD")
-    for node in STANDBY_NODES:
-        crname = f"backup-{node}-{int(time.time())}"
-        create_vnfbackup_cr(crname, f"node:{node}")
-        monitor_cr
+import sys
 
+from vnfctl.cli import main
 
+if __name__ == "__main__":
+    sys.exit(main(["run"] + sys.argv[1:]))
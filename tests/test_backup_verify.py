@@ -0,0 +1,31 @@
+from vnfctl import backup_verify
+
+def _write(path, data: bytes):
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+def test_report_counts_untracked_separately_and_fails_required(tmp_path):
+    _write(tmp_path / "vnf-a.tgz", b"a" * 100)
+    _write(tmp_path / "vnf-b.tgz", b"b" * 100)
+    backup_verify.record_all(str(tmp_path))
+    _write(tmp_path / "vnf-b.tgz", b"B" * 100)  # corrupt, same size
+    _write(tmp_path / "vnf-c.tgz", b"c" * 100)  # never recorded
+
+    results, elapsed = backup_verify.verify_all(str(tmp_path))
+    assert sorted((n, s) for n, s, _ in results) == [
+        ("vnf-a.tgz", "OK"), ("vnf-b.tgz", "CORRUPT"), ("vnf-c.tgz", "UNTRACKED")]
+
+    lines = []
+    assert not backup_verify.report(results, elapsed, log=lines.append)
+    assert "3 artifacts: 1 OK, 1 failed, 1 untracked" in lines[-1]
+
+def test_untracked_restore_input_fails_the_gate(tmp_path):
+    _write(tmp_path / "vnf-a.tgz", b"a" * 100)
+    backup_verify.record_all(str(tmp_path))
+    _write(tmp_path / "vnf-c.tgz", b"c" * 100)
+    results, elapsed = backup_verify.verify_all(str(tmp_path))
+
+    assert backup_verify.report(results, elapsed, log=lambda _: None)
+    lines = []
+    assert not backup_verify.report(results, elapsed, log=lines.append, required=["vnf-c.tgz"])
+    assert any(l.startswith("ALERT: backup artifact vnf-c.tgz: UNTRACKED") for l in lines)
@@ -0,0 +1,46 @@
+import os
+
+from vnfctl import delta_restore
+
+BLOCK = 4096
+
+def _write(path, data: bytes):
+    with open(path, "wb") as fh:
+        fh.write(data)
+
+def _read(path) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+def test_delta_restore_rewrites_only_changed_blocks(tmp_path):
+    backup, disk = tmp_path / "vnf-a.img", tmp_path / "disk.img"
+    data = os.urandom(BLOCK * 8)
+    _write(backup, data)
+    damaged = bytearray(data)
+    damaged[BLOCK * 3:BLOCK * 3 + 4] = b"XXXX"
+    _write(disk, bytes(damaged))
+    delta_restore.record_block_manifest(str(backup), block_size=BLOCK)
+
+    st = delta_restore.delta_restore(str(backup), str(disk))
+
+    assert st["manifest"] == "recorded"
+    assert st["changed"] == 1
+    assert _read(disk) == data
+
+def test_stale_sidecar_for_same_size_image_is_not_trusted(tmp_path):
+    backup, disk = tmp_path / "vnf-a.img", tmp_path / "disk.img"
+    old = os.urandom(BLOCK * 8)
+    _write(backup, old)
+    delta_restore.record_block_manifest(str(backup), block_size=BLOCK)
+    # new backup of the same size lands without its sidecar being refreshed
+    new = os.urandom(BLOCK * 8)
+    _write(backup, new)
+    os.utime(backup, ns=(os.stat(backup).st_atime_ns, os.stat(backup).st_mtime_ns + 1))
+    _write(disk, old)
+
+    assert delta_restore.load_block_manifest(str(backup)) is None
+    st = delta_restore.delta_restore(str(backup), str(disk))
+
+    assert st["manifest"] == "computed"
+    assert st["changed"] == st["blocks"]
+    assert _read(disk) == new
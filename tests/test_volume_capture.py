@@ -0,0 +1,32 @@
+import errno
+import os
+
+import pytest
+
+from vnfctl import volume_capture
+
+def test_capture_copies_the_volume(tmp_path):
+    src, dst = tmp_path / "pvc.img", tmp_path / "backup.img"
+    data = os.urandom(300000)
+    src.write_bytes(data)
+
+    method, copied, _ = volume_capture.capture_volume(str(src), str(dst))
+
+    assert copied == len(data)
+    assert dst.read_bytes() == data
+    assert sorted(os.listdir(tmp_path)) == ["backup.img", "pvc.img"]
+
+def test_failed_capture_leaves_no_tmp_file(tmp_path, monkeypatch):
+    src, dst = tmp_path / "pvc.img", tmp_path / "backup.img"
+    src.write_bytes(os.urandom(300000))
+
+    def broken(*args):
+        raise OSError(errno.EIO, "I/O error")
+    monkeypatch.setattr(volume_capture, "_try_reflink", lambda sfd, dfd: False)
+    monkeypatch.setattr(volume_capture, "_copy_kernel", broken)
+    monkeypatch.setattr(volume_capture, "_copy_readinto", broken)
+
+    with pytest.raises(OSError):
+        volume_capture.capture_volume(str(src), str(dst))
+
+    assert os.listdir(tmp_path) == ["pvc.img"]
@@ -0,0 +1,23 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from vnfctl import whatif
+
+def test_rpo_stays_within_one_interval_even_when_cycles_overlap():
+    for interval in (60.0, 86400.0):  # the default inventory takes ~100s per cycle
+        res = whatif.simulate(trials=5000, interval=interval, seed=7)
+        for r in res.values():
+            assert all(0.0 <= v < interval for v in r["rpo"])
+
+def test_rto_does_not_grow_with_more_restore_streams():
+    rto = [whatif.simulate(trials=5000, parallelism=p, seed=7) for p in (1, 2, 4)]
+    for node in rto[0]:
+        for fewer, more in zip(rto, rto[1:]):
+            assert all(b <= a + 1e-9 for a, b in zip(fewer[node]["rto"], more[node]["rto"]))
+
+@pytest.mark.parametrize("kwargs", [{"restore_mbps": 0}, {"backup_mbps": 0}, {"jitter": -0.1},
+                                    {"detect": -1}, {"reinstall": -1}, {"per_vm_overhead": -1}])
+def test_invalid_parameters_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        whatif.simulate(trials=10, **kwargs)
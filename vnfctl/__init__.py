@@ -0,0 +1,7 @@
+"""
+vnfctl
+
+VNF Cluster Backup and Restore Controller using VnfBackup CRD.
+Entry point: python3 -m vnfctl (see vnfctl/cli.py). Importing the package is
+deliberately cheap; submodules are loaded on demand.
+"""
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+vnfctl/bench_startup.py
+
+Import-time / cold-start benchmark for the vnfctl CLI.
+
+Runs short commands in fresh interpreters, reports median wall time, and checks
+that heavy modules were not pulled in by commands that do not need them.
+
+Usage
+- python3 -m vnfctl.bench_startup
+- python3 -m vnfctl.bench_startup --runs 20 --budget-ms 50
+"""
+
+import os, sys, json, time, argparse, statistics, subprocess
+from typing import List
+
+HEAVY_MODULES = ["vnfctl.progress", "yaml", "numpy", "vnfctl.phases", "concurrent.futures"]
+
+COMMANDS = [
+    ("python -c pass (baseline)", ["-c", "pass"]),
+    ("import vnfctl.cli", ["-c", "import vnfctl.cli"]),
+    ("vnfctl status", ["-m", "vnfctl", "status"]),
+    ("vnfctl run --dry-run", ["-m", "vnfctl", "run", "--dry-run"]),
+]
+
+PROBE = (
+    "import sys, runpy, io, contextlib, json\n"
+    "sys.argv = ['vnfctl'] + {argv!r}\n"
+    "with contextlib.redirect_stdout(io.StringIO()):\n"
+    "    try: runpy.run_module('vnfctl', run_name='__main__')\n"
+    "    except SystemExit: pass\n"
+    "print(json.dumps([m for m in {heavy!r} if m in sys.modules]))\n"
+)
+
+def _env():
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+def time_command(args: List[str], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, env=_env(), stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def heavy_loaded(cli_args: List[str]) -> List[str]:
+    out = subprocess.run([sys.executable, "-c", PROBE.format(argv=cli_args, heavy=HEAVY_MODULES)],
+                         env=_env(), capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark vnfctl CLI start-up time.")
+    p.add_argument("--runs", type=int, default=10, help="Interpreter launches per command (median is reported)")
+    p.add_argument("--budget-ms", type=float, default=0, help="Fail if a vnfctl command exceeds baseline + budget")
+    args = p.parse_args()
+
+    baseline = None
+    failed = False
+    print(f"{'COMMAND':<28} | {'MEDIAN':>9} | {'OVER BASE':>9} | HEAVY MODULES LOADED")
+    print(f"{'-'*28}-+-{'-'*9}-+-{'-'*9}-+-{'-'*22}")
+    for label, cmd in COMMANDS:
+        ms = time_command(cmd, args.runs)
+        baseline = ms if baseline is None else baseline
+        heavy = heavy_loaded(cmd[2:]) if cmd[:2] == ["-m", "vnfctl"] else []
+        print(f"{label:<28} | {ms:7.1f}ms | {ms - baseline:7.1f}ms | {', '.join(heavy) or '-'}")
+        if cmd[:2] == ["-m", "vnfctl"] and (heavy or (args.budget_ms and ms - baseline > args.budget_ms)):
+            failed = True
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+vnfctl/cli.py
+
+Single entry point for the VnfBackup controller.
+
+Usage examples
+- python3 -m vnfctl status                     # node roles and VM inventory, no sleeps
+- python3 -m vnfctl run --dry-run              # print the plan a full run would execute
+- python3 -m vnfctl run                        # full backup / switchover / restore workflow
+- python3 -m vnfctl run --per-vm-crs           # one VnfBackup CR per VM (fs2.py flavour)
+- python3 -m vnfctl run --rolling              # switch over and back up one node pair at a time
+- python3 -m vnfctl run --delta-restore        # rewrite only changed blocks of surviving VM disks
+- python3 -m vnfctl run --crd-file crd.yaml    # also back up the CRD's VM/DB/Volume/File components
+- python3 -m vnfctl verify /srv/backups        # verify backup artifacts against MANIFEST.json
+- python3 -m vnfctl whatif --parallelism 1,4   # Monte Carlo RTO/RPO percentiles per node
+
+Only argparse and the stdlib-only vnfctl.core are imported up front; the phase
+module and its dependencies (yaml, progress rendering, hashing, ...) load when a command needs them.
+"""
+
+import argparse
+from typing import List, Optional
+
+from .core import log, RTRV_OUTPUT, NODE_VMS_LIST, VM_SIZE_LIST
+
+# ------------------ Commands ------------------
+
+def cmd_status(args) -> int:
+    print(f"{'NODE':<15} | {'ROLE':<10} | VMS")
+    print(f"{'-'*15}-+-{'-'*10}-+-{'-'*30}")
+    for node, state in RTRV_OUTPUT:
+        vms = ", ".join(f"{vm}({VM_SIZE_LIST.get(vm, 300)}MB)" for vm in NODE_VMS_LIST.get(node, []))
+        print(f"{node:<15} | {state:<10} | {vms}")
+    return 0
+
+def _plan_backups(step: int, prefix: str, nodes: List[str]):
+    for node in nodes:
+        vms = NODE_VMS_LIST.get(node, [])
+        total = sum(VM_SIZE_LIST.get(vm, 300) for vm in vms)
+        log(f"{step}. {prefix} {node}: {', '.join(vms) or '-'} ({total}MB)")
+
+def cmd_plan(args) -> int:
+    active = [n for n, s in RTRV_OUTPUT if s == "ACTIVE"]
+    standby = [n for n, s in RTRV_OUTPUT if s != "ACTIVE"]
+    log("DRY RUN: no CRs are created and nothing is copied")
+    log("1. Pre-checks: BKUP.PKG, CRTE-FW.PKG, RTRV-NODE-STS, CRD presence")
+    if args.rolling and active and standby:
+        leftover = standby[len(active):]
+        _plan_backups(2, "backup-standby", leftover)
+        for i, act in enumerate(active):
+            stb = standby[i % len(standby)]
+            pre = f"backup-standby {stb}" if i < len(standby) else f"{stb} already backed up"
+            log(f"2. pair {i + 1}: {pre} | FFO {act} -> {stb} | backup-prevactive {act}")
+        if leftover:
+            log(f"3. Promote {leftover} (no active partner) to ACTIVE")
+    else:
+        _plan_backups(2, "backup-standby", standby)
+        log(f"3. Switchover: promote {standby} to ACTIVE")
+        _plan_backups(4, "backup-prevactive", active)
+    if args.crd_file:
+        log(f"5. CRD components from {args.crd_file}")
+    log("6. Verify backup artifacts, post-checks and restore, summary")
+    return 0
+
+def cmd_run(args) -> int:
+    if args.dry_run:
+        return cmd_plan(args)
+    from . import phases
+    log("Starting VNF Cluster backup and restore using VnfBackup CRD\n")
+    phases.pre_checks()
+    backup = phases.backup_nodes_per_vm if args.per_vm_crs else phases.backup_nodes
+    if args.rolling:
+        # Pair-by-pair switchover, pipelining the next standby backup
+        phases.rolling_switchover(backup)
+    else:
+        # Backup standby nodes first
+        backup(phases.STANDBY_NODES, "backup-standby")
+        # Switchover / FFO
+        phases.switchover()
+        # Backup previous active nodes (now standby)
+        backup(phases.STANDBY_NODES, "backup-prevactive")
+    # Backup CRD components (VM/DB/Volume/File) for full policy
+    if args.crd_file:
+        phases.backup_crd_components(phases.load_crd(args.crd_file))
+    phases.verify_backups()
+    phases.post_checks_and_restore(args.delta_restore)
+    phases.final_summary()
+    return 0
+
+def cmd_verify(args) -> int:
+    import os
+    from . import backup_verify
+    if args.record:
+        manifest = backup_verify.record_all(args.root, args.workers)
+        print(f"Recorded {len(manifest)} artifacts in {os.path.join(args.root, backup_verify.MANIFEST_NAME)}")
+        return 0
+    results, elapsed = backup_verify.verify_all(args.root, args.workers)
+    return 0 if backup_verify.report(results, elapsed) else 1
+
+def cmd_whatif(args) -> int:
+    from . import whatif
+    return whatif.run(args)
+
+# ------------------ CLI ------------------
+
+def parse_args(argv: Optional[List[str]] = None):
+    p = argparse.ArgumentParser(prog="vnfctl", description="VNF Cluster backup and restore controller (VnfBackup CRD).")
+    sub = p.add_subparsers(dest="command")
+
+    sub.add_parser("status", help="Show node roles and VM inventory.").set_defaults(func=cmd_status)
+
+    run = sub.add_parser("run", help="Run the backup / switchover / restore workflow.")
+    run.add_argument("--dry-run", action="store_true", help="Print the plan without executing it.")
+    run.add_argument("--per-vm-crs", action="store_true", help="Create one VnfBackup CR per VM and print its YAML.")
+    run.add_argument("--rolling", action="store_true", help="Switch over and back up active/standby pairs one at a time.")
+    run.add_argument("--delta-restore", action="store_true",
+                     help="Restore damaged VMs by rewriting only blocks that differ from the backup image.")
+    run.add_argument("--crd-file", help="VnfBackup CRD YAML whose components are backed up as well.")
+    run.set_defaults(func=cmd_run)
+
+    ver = sub.add_parser("verify", help="Verify backup artifacts against their recorded digests.")
+    ver.add_argument("root", help="Local backup root containing the artifacts and MANIFEST.json")
+    ver.add_argument("--record", action="store_true", help="Record digests instead of verifying.")
+    ver.add_argument("--workers", type=int, help="Hashing threads (default: CPU count)")
+    ver.set_defaults(func=cmd_verify)
+
+    wif = sub.add_parser("whatif", help="Estimate RTO/RPO percentiles per node with a Monte Carlo simulation.")
+    from .whatif import add_arguments
+    add_arguments(wif)
+    wif.set_defaults(func=cmd_whatif)
+
+    args = p.parse_args(argv)
+    if not args.command:
+        p.print_help()
+        p.exit(2)
+    return args
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,80 @@
+"""
+vnfctl/core.py
+
+Shared helpers and cluster inventory for the VnfBackup controller.
+Keep this module stdlib-only and cheap: it is imported by every CLI invocation,
+including status checks and dry runs. Heavier modules (yaml, progress, ...) are
+imported inside the function that needs them.
+"""
+
+import os, sys, time, datetime, threading
+from typing import List, Dict, Tuple
+
+# ------------------ Utility functions ------------------
+
+def now_ts() -> str:
+    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+
+_print_lock = threading.Lock()
+
+def _write_line(line: str):
+    """Write `line` (may span several lines) with one call under a lock.
+
+    print() writes the text and the newline separately, so lines from concurrent
+    threads or processes can tear into each other. Pass whole blocks to keep them intact.
+    """
+    with _print_lock:
+        sys.stdout.write(line + "\n")
+
+# Swapped for the progress renderer's writer while bars are on screen (see progress.py)
+_printer = _write_line
+
+def log(msg: str):
+    _printer(f"[{now_ts()}] {msg}")
+
+def progress_bar(label: str, duration: float, total: float = 0, unit: str = "s"):
+    """Simulate `duration` seconds of work, reported as `total` `unit` (default: the seconds)."""
+    from .progress import MANAGER
+    total = total or duration
+    steps = max(1, int(duration * 10))
+    with MANAGER.task(label, total, unit) as t:
+        for _ in range(steps):
+            time.sleep(duration / steps)
+            t.advance(total / steps)
+
+# ------------------ Cluster & VM Data ------------------
+
+RTRV_OUTPUT: List[Tuple[str, str]] = [
+    ("vnf-node-01", "ACTIVE"),
+    ("vnf-node-02", "ACTIVE"),
+    ("vnf-node-03", "STANDBY"),
+    ("vnf-node-04", "STANDBY"),
+    ("vnf-node-05", "ACTIVE"),
+]
+
+NODE_VMS_LIST: Dict[str, List[str]] = {
+    "vnf-node-01": ["vnf-a", "vnf-b"],
+    "vnf-node-02": ["vnf-c"],
+    "vnf-node-03": ["vnf-d"],
+    "vnf-node-04": ["vnf-e", "vnf-f"],
+    "vnf-node-05": ["vnf-g"]
+}
+
+VM_SIZE_LIST: Dict[str, int] = {
+    "vnf-a": 1200,
+    "vnf-b": 800,
+    "vnf-c": 600,
+    "vnf-d": 400,
+    "vnf-e": 200,
+    "vnf-f": 300,
+    "vnf-g": 900
+}
+
+# Local directory backing external-storage://backups/ (unset = log-only, nothing to verify)
+BACKUP_ROOT = os.environ.get("VNF_BACKUP_ROOT", "")
+# Local-disk backend: PVC images live at {PVC_ROOT}/{pvc}.img
+PVC_ROOT = os.environ.get("VNF_PVC_ROOT", "")
+# Embedded DB stand-in: {DB_ROOT}/{appBindingRef}/{database}.db
+DB_ROOT = os.environ.get("VNF_DB_ROOT", "")
+# Surviving VM disks on a repaired host: {VM_DISK_ROOT}/{vm}.img (delta restore target)
+VM_DISK_ROOT = os.environ.get("VNF_VM_DISK_ROOT", "")
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+vnfctl/delta_restore.py
+
+Block-level delta restore of raw disk images against a surviving disk.
+
+- At backup time block_manifest() hashes the image in BLOCK_SIZE blocks and the
+  digests are stored next to the artifact as {name}.blocks (JSON), together with the
+  image's identity (size, mtime_ns, inode). A sidecar whose identity no longer matches
+  the image is ignored and the digests are recomputed from the image.
+- At restore time the surviving disk is hashed block by block in parallel and only
+  blocks whose digest differs from the manifest are read from the backup and
+  written in place (os.preadv/os.pwrite on reused buffers). The disk is then
+  truncated/extended to the backup size.
+
+Only raw images ({vm}.img, {pvc}.img) qualify; compressed {vm}.tgz artifacts have no
+stable block layout and are always restored in full.
+
+Usage
+- python3 -m vnfctl.delta_restore /srv/backups/vnf-a.img /var/lib/vms/vnf-a.img
+- python3 -m vnfctl.delta_restore /srv/backups/vnf-a.img --record   # write vnf-a.img.blocks
+"""
+
+import os, json, time, hashlib, argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+BLOCK_SIZE = 4 * 1024 * 1024
+BLOCK_SUFFIX = ".blocks"
+DIGEST_SIZE = 16
+
+def _digest(data) -> str:
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+def _ranges(n_blocks: int, workers: int) -> List[range]:
+    step = max(1, -(-n_blocks // workers))
+    return [range(i, min(i + step, n_blocks)) for i in range(0, n_blocks, step)]
+
+def _hash_range(path: str, blocks: range, block_size: int) -> List[str]:
+    buf = bytearray(block_size)
+    view = memoryview(buf)
+    out = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        for b in blocks:
+            n = os.preadv(fd, [buf], b * block_size)
+            out.append(_digest(view[:n]))
+    finally:
+        os.close(fd)
+    return out
+
+# ------------------ Manifest ------------------
+
+def _identity(path: str) -> Dict:
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "inode": st.st_ino}
+
+def block_manifest(path: str, block_size: int = BLOCK_SIZE, workers: Optional[int] = None) -> Dict:
+    identity = _identity(path)
+    size = identity["size"]
+    n_blocks = -(-size // block_size)
+    workers = workers or os.cpu_count() or 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(lambda r: _hash_range(path, r, block_size), _ranges(n_blocks, workers))
+        blocks = [d for part in parts for d in part]
+    # identity is taken before hashing: a write during hashing changes mtime and voids the sidecar
+    return {"algo": f"blake2b-{DIGEST_SIZE}", "block_size": block_size, "size": size,
+            "image": identity, "blocks": blocks}
+
+def record_block_manifest(path: str, block_size: int = BLOCK_SIZE) -> Dict:
+    manifest = block_manifest(path, block_size)
+    tmp = path + BLOCK_SUFFIX + ".tmp"
+    with open(tmp, "w") as fh:
+        json.dump(manifest, fh)
+    os.replace(tmp, path + BLOCK_SUFFIX)
+    return manifest
+
+def load_block_manifest(path: str) -> Optional[Dict]:
+    if not os.path.isfile(path + BLOCK_SUFFIX):
+        return None
+    with open(path + BLOCK_SUFFIX, "r") as fh:
+        manifest = json.load(fh)
+    # a manifest for a different (or rewritten) image is worse than none
+    if manifest.get("image") != _identity(path):
+        return None
+    return manifest
+
+# ------------------ Restore ------------------
+
+def _restore_range(backup_path: str, target_path: str, blocks: range, block_size: int, want: List[str], size: int) -> List[int]:
+    buf = bytearray(block_size)
+    view = memoryview(buf)
+    changed, written = 0, 0
+    src = os.open(backup_path, os.O_RDONLY)
+    dst = os.open(target_path, os.O_RDWR)
+    try:
+        target_size = os.fstat(dst).st_size
+        for b in blocks:
+            off = b * block_size
+            length = min(block_size, size - off)
+            if off < target_size:
+                n = os.preadv(dst, [view[:length]], off)
+                if n == length and _digest(view[:length]) == want[b]:
+                    continue
+            n = os.preadv(src, [view[:length]], off)
+            if n != length:
+                raise IOError(f"short read from {backup_path} at {off}: {n}/{length}")
+            done = 0
+            while done < length:
+                done += os.pwrite(dst, view[done:length], off + done)
+            changed += 1
+            written += length
+    finally:
+        os.close(src)
+        os.close(dst)
+    return [changed, written]
+
+def delta_restore(backup_path: str, target_path: str, workers: Optional[int] = None) -> Dict:
+    """Bring target_path in line with backup_path rewriting only differing blocks.
+
+    Returns {"blocks", "changed", "bytes_written", "seconds", "manifest"}.
+    """
+    start = time.perf_counter()
+    manifest = load_block_manifest(backup_path)
+    source = "recorded"
+    if manifest is None:
+        # no usable manifest: hash the backup now (reads more, still writes only the delta)
+        manifest = block_manifest(backup_path, workers=workers)
+        source = "computed"
+    block_size, size, want = manifest["block_size"], manifest["size"], manifest["blocks"]
+    if not os.path.exists(target_path):
+        open(target_path, "wb").close()
+    workers = workers or os.cpu_count() or 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(lambda r: _restore_range(backup_path, target_path, r, block_size, want, size),
+                              _ranges(len(want), workers)))
+    fd = os.open(target_path, os.O_RDWR)
+    try:
+        os.ftruncate(fd, size)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    return {
+        "blocks": len(want),
+        "changed": sum(p[0] for p in parts),
+        "bytes_written": sum(p[1] for p in parts),
+        "seconds": time.perf_counter() - start,
+        "manifest": source,
+    }
+
+# ------------------ CLI ------------------
+
+def main():
+    p = argparse.ArgumentParser(description="Restore a raw disk image rewriting only blocks that differ.")
+    p.add_argument("backup", help="Raw backup image (with optional {backup}.blocks manifest)")
+    p.add_argument("target", nargs="?", help="Surviving disk image to repair in place")
+    p.add_argument("--record", action="store_true", help="Write the block manifest for BACKUP and exit.")
+    p.add_argument("--workers", type=int, help="Threads (default: CPU count)")
+    args = p.parse_args()
+    if args.record:
+        m = record_block_manifest(args.backup)
+        print(f"Recorded {len(m['blocks'])} blocks in {args.backup}{BLOCK_SUFFIX}")
+        return
+    if not args.target:
+        p.error("target is required unless --record is given")
+    st = delta_restore(args.backup, args.target, args.workers)
+    print(f"Rewrote {st['changed']}/{st['blocks']} blocks ({st['bytes_written'] / 1e6:.1f}MB) "
+          f"in {st['seconds']:.2f}s using {st['manifest']} manifest")
+
+if __name__ == "__main__":
+    main()
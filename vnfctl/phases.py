@@ -0,0 +1,333 @@
+"""
+vnfctl/phases.py
+
+VnfBackup CRD helpers, per-component backup functions and the controller phases.
+All operations are log-only unless VNF_BACKUP_ROOT / VNF_PVC_ROOT point at local disk.
+"""
+
+import os, sys, time
+from typing import List, Dict, Optional
+
+from . import core
+from .core import log, now_ts, progress_bar, RTRV_OUTPUT, NODE_VMS_LIST, VM_SIZE_LIST, BACKUP_ROOT, PVC_ROOT, DB_ROOT, VM_DISK_ROOT
+
+# ------------------ Global Node Lists ------------------
+ACTIVE_NODES: List[str] = []
+STANDBY_NODES: List[str] = []
+
+# ------------------ CRD Helpers ------------------
+
+def load_crd(path: str) -> Dict:
+    import yaml
+    with open(path, "r") as fh:
+        return yaml.safe_load(fh) or {}
+
+def create_vnfbackup_cr(name: str, target: str, vm_name: Optional[str] = None) -> Dict:
+    log(f"Creating VnfBackup CR: name={name} target={target}")
+    time.sleep(0.5)
+    log(f"VnfBackup/{name} created. status=Pending")
+    return {"name": name, "target": target, "vm_name": vm_name, "status": "Pending"}
+
+def update_cr_status(cr: Dict, status: str):
+    cr["status"] = status
+    log(f"VnfBackup/{cr['name']} status={status}")
+
+def monitor_cr_status(name: str):
+    log(f"Monitoring VnfBackup/{name} status")
+    time.sleep(0.5)
+    log(f"VnfBackup/{name} status=InProgress")
+    progress_bar(f"CRD:{name} backup progress", 3)
+    time.sleep(0.3)
+    log(f"VnfBackup/{name} status=Completed")
+
+def kubectl_get_vnfbackup_yaml(cr: Dict):
+    yaml_output = f"""apiVersion: kubevirt.io/v1alpha1
+kind: VNFBackup
+metadata:
+  name: {cr['name']}
+  namespace: default
+  creationTimestamp: "{now_ts()}"
+spec:
+  status: {cr['status']}
+  storageLocation: external-storage://backups/{cr['vm_name']}
+  vmName: {cr['vm_name']}
+"""
+    core._printer(yaml_output.rstrip("\n"))
+
+# ------------------ Backup Functions ------------------
+
+def backup_vm(vm: str, size_mb: int):
+    log(f"START backup of VM: {vm} | PV size: {size_mb}MB | target: external-storage://backups/{vm}.tgz")
+    duration = (size_mb // 50) + 2
+    progress_bar(f"Backing up {vm}", duration, size_mb, "MB")
+    log(f"COMPLETE backup of VM: {vm} | stored at external-storage://backups/{vm}.tgz")
+    if BACKUP_ROOT and os.path.isfile(os.path.join(BACKUP_ROOT, f"{vm}.tgz")):
+        from . import backup_verify
+        digest = backup_verify.record_artifact(BACKUP_ROOT, f"{vm}.tgz")
+        log(f"Recorded {backup_verify.HASH_ALGO} for {vm}.tgz: {digest[:16]}...")
+    if BACKUP_ROOT and os.path.isfile(os.path.join(BACKUP_ROOT, f"{vm}.img")):
+        from . import backup_verify, delta_restore
+        backup_verify.record_artifact(BACKUP_ROOT, f"{vm}.img")
+        manifest = delta_restore.record_block_manifest(os.path.join(BACKUP_ROOT, f"{vm}.img"))
+        backup_verify.record_artifact(BACKUP_ROOT, f"{vm}.img{delta_restore.BLOCK_SUFFIX}")
+        log(f"Recorded block manifest for {vm}.img: {len(manifest['blocks'])} blocks")
+
+def backup_db(db_name: str):
+    log(f"Starting database backup: {db_name}")
+    progress_bar(f"DB Backup {db_name}", 2)
+    log(f"Database backup complete: {db_name}")
+
+def backup_databases(db_comp: Dict):
+    dbs = db_comp["taskParams"]["databases"]
+    binding = db_comp.get("appBindingRef", "")
+    src = os.path.join(DB_ROOT, binding) if DB_ROOT and binding else ""
+    if not (BACKUP_ROOT and src and os.path.isdir(src)):
+        for db in dbs:
+            backup_db(db)
+        return
+    from . import backup_verify, db_backup
+    log(f"Starting {db_comp.get('dbType', 'database')} backup of {', '.join(dbs)} via {binding} (single snapshot)")
+    try:
+        stats = db_backup.dump_databases(db_backup.SQLiteSource(src), dbs,
+                                         lambda db: open(os.path.join(BACKUP_ROOT, f"{db}.sql.gz"), "wb"))
+    except FileNotFoundError as e:
+        log(f"ALERT: database backup via {binding} failed: {e}")
+        sys.exit(2)
+    for db, st in stats.items():
+        log(f"Database backup complete: {db} | {st['tables']} tables, {st['rows']} rows, "
+            f"{st['bytes'] // (1024 * 1024)}MB gz in {st['seconds']:.2f}s")
+        backup_verify.record_artifact(BACKUP_ROOT, f"{db}.sql.gz")
+
+def backup_volume(pvc: str):
+    src = os.path.join(PVC_ROOT, f"{pvc}.img") if PVC_ROOT else ""
+    if not (BACKUP_ROOT and src and os.path.isfile(src)):
+        log(f"Backing up volume: {pvc} using CSI snapshot")
+        progress_bar(f"Volume Backup {pvc}", 2)
+        log(f"Volume backup complete: {pvc}")
+        return
+    from . import backup_verify, delta_restore, volume_capture
+    log(f"Backing up volume: {pvc} from local disk {src}")
+    method, copied, elapsed = volume_capture.capture_volume(src, os.path.join(BACKUP_ROOT, f"{pvc}.img"))
+    rate = (copied / 1e6) / elapsed if elapsed > 0 else 0.0
+    log(f"Volume backup complete: {pvc} | {copied // (1024 * 1024)}MB via {method} in {elapsed:.2f}s ({rate:.0f} MB/s)")
+    backup_verify.record_artifact(BACKUP_ROOT, f"{pvc}.img")
+    delta_restore.record_block_manifest(os.path.join(BACKUP_ROOT, f"{pvc}.img"))
+    backup_verify.record_artifact(BACKUP_ROOT, f"{pvc}.img{delta_restore.BLOCK_SUFFIX}")
+
+def backup_file(pod: str, path_includes: List[str], path_excludes: List[str]):
+    log(f"Backing up files from pod: {pod}")
+    for p in path_includes:
+        progress_bar(f"File Backup {pod}:{p}", 1)
+    log(f"Excluding paths: {', '.join(path_excludes)}")
+    log(f"File backup complete for pod: {pod}")
+
+def restore_pkg(pkg: str):
+    log(f"Restoring package: {pkg}")
+    time.sleep(1)
+    log(f"Restore complete: {pkg}")
+
+# ------------------ Controller Phases ------------------
+
+def print_node_table():
+    lines = [f"\n{'NODE':<15} | {'ROLE':<10}", f"{'-'*15}-+-{'-'*10}"]
+    lines += [f"{node:<15} | {state:<10}" for node, state in RTRV_OUTPUT]
+    core._printer("\n".join(lines) + "\n")
+
+def group_nodes():
+    global ACTIVE_NODES, STANDBY_NODES
+    ACTIVE_NODES = [node for node, state in RTRV_OUTPUT if state == "ACTIVE"]
+    STANDBY_NODES = [node for node, state in RTRV_OUTPUT if state != "ACTIVE"]
+
+def pre_checks():
+    log("PHASE: Pre-checks")
+    log("Verifying backup packages: BKUP.PKG, CRTE-FW.PKG")
+    time.sleep(0.5)
+    log("BKUP.PKG: available")
+    log("CRTE-FW.PKG: available")
+    time.sleep(0.3)
+
+    log("Running RTRV-NODE-STS to gather VNF node status")
+    for node, state in RTRV_OUTPUT:
+        log(f"RTRV-NODE-STS > {node} {state}")
+    group_nodes()
+
+    log("Grouped nodes:")
+    print_node_table()
+
+    log("Checking for VnfBackup CRD presence")
+    time.sleep(0.5)
+    log("CRD vnfbackups.mydomain/v1: present\n")
+
+def backup_nodes(nodes: List[str], cr_prefix: str):
+    for node in nodes:
+        crname = f"{cr_prefix}-{node}-{int(time.time())}"
+        create_vnfbackup_cr(crname, f"node:{node}")
+        monitor_cr_status(crname)
+        for vm in NODE_VMS_LIST.get(node, []):
+            backup_vm(vm, VM_SIZE_LIST.get(vm, 300))
+
+def backup_nodes_per_vm(nodes: List[str], cr_prefix: str):
+    """One VnfBackup CR per VM (plus its {vm}-db), printing the resulting CR YAML."""
+    for node in nodes:
+        for vm in NODE_VMS_LIST.get(node, []):
+            cr = create_vnfbackup_cr(f"{cr_prefix}-{vm}-{int(time.time())}", f"node:{node}", vm)
+            update_cr_status(cr, "InProgress")
+            backup_vm(vm, VM_SIZE_LIST.get(vm, 300))
+            update_cr_status(cr, "Completed")
+            kubectl_get_vnfbackup_yaml(cr)
+            backup_db(f"{vm}-db")
+
+def backup_crd_components(crd: Dict):
+    components = crd.get("spec", {}).get("components", [])
+    for comp in components:
+        typ = comp.get("type")
+        if typ == "VirtualMachine":
+            vm_name = comp["vmComponent"]["vmName"]
+            backup_vm(vm_name, 500)  # Use 500MB default if not specified
+        elif typ == "Database":
+            backup_databases(comp["dbComponent"])
+        elif typ == "Volume":
+            pvc = comp["volumeComponent"]["pvcName"]
+            backup_volume(pvc)
+        elif typ == "File":
+            pod = comp["fileComponent"]["podRef"]
+            includes = comp["fileComponent"]["pathIncludes"]
+            excludes = comp["fileComponent"]["pathExcludes"]
+            backup_file(pod, includes, excludes)
+
+def switchover():
+    global ACTIVE_NODES, STANDBY_NODES
+    log("PHASE: Fast Failover / Switchover")
+    log("Initiating fast failover (FFO). Standby nodes promoted to active.")
+    time.sleep(1)
+    ACTIVE_NODES, STANDBY_NODES = STANDBY_NODES, ACTIVE_NODES
+    log(f"New ACTIVE nodes: {ACTIVE_NODES}")
+    log(f"New STANDBY nodes: {STANDBY_NODES}")
+
+def switch_pair(active: str, standby: str):
+    if standby in STANDBY_NODES:
+        log(f"Fast failover (FFO) {active} -> {standby}: {standby} promoted to active")
+        STANDBY_NODES.remove(standby)
+        ACTIVE_NODES.append(standby)
+    else:
+        log(f"Fast failover (FFO) {active} -> {standby}: workload moves onto already active {standby}")
+    time.sleep(1)
+    ACTIVE_NODES.remove(active)
+    STANDBY_NODES.append(active)
+
+def rolling_switchover(backup=backup_nodes):
+    """Fail over one active/standby pair at a time instead of the whole cluster.
+
+    Every standby is backed up before it is promoted, and the next pair's standby
+    backup runs in the background while the current pair fails over and its former
+    active is backed up. Surplus actives re-pair round-robin with already promoted
+    standbys; surplus standbys are backed up first and promoted once every pair has
+    failed over, so the end state matches switchover().
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    log("PHASE: Rolling Fast Failover / Switchover")
+    actives, standbys = list(ACTIVE_NODES), list(STANDBY_NODES)
+    if not actives or not standbys:
+        log("Rolling switchover needs at least one ACTIVE and one STANDBY node; nothing to do")
+        return
+    pairs = [(a, standbys[i % len(standbys)]) for i, a in enumerate(actives)]
+    # standbys that end up with no partner still get their backup
+    leftover = standbys[len(pairs):]
+    backup(leftover, "backup-standby")
+    todo = list(dict.fromkeys(stb for _, stb in pairs))  # unique standbys in promotion order
+    start, worst = time.perf_counter(), 0.0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        futures = {todo[0]: pool.submit(backup, [todo[0]], "backup-standby")}
+        for i, (act, stb) in enumerate(pairs):
+            futures[stb].result()  # never promote a standby without a fresh backup
+            if len(futures) < len(todo):
+                nxt = todo[len(futures)]
+                futures[nxt] = pool.submit(backup, [nxt], "backup-standby")
+            failover = time.perf_counter()
+            switch_pair(act, stb)
+            backup([act], "backup-prevactive")
+            window = time.perf_counter() - failover
+            worst = max(worst, window)
+            log(f"Pair {i + 1}/{len(pairs)} ({act} -> {stb}) protected again after {window:.1f}s")
+    for stb in leftover:
+        log(f"Promoting {stb} (no active partner) to active")
+        STANDBY_NODES.remove(stb)
+        ACTIVE_NODES.append(stb)
+    log(f"Rolling switchover complete in {time.perf_counter() - start:.1f}s; longest unprotected window {worst:.1f}s")
+    log(f"New ACTIVE nodes: {ACTIVE_NODES}")
+    log(f"New STANDBY nodes: {STANDBY_NODES}")
+
+def verify_backups():
+    log("PHASE: Backup integrity verification")
+    if not BACKUP_ROOT or not os.path.isdir(BACKUP_ROOT):
+        log("VNF_BACKUP_ROOT not set; skipping artifact verification")
+        return
+    from . import backup_verify, delta_restore
+    # what restore_vm() may read: an untracked copy of these must not pass the gate
+    restore_inputs = [f"{vm}{ext}" for vms in NODE_VMS_LIST.values() for vm in vms
+                      for ext in (".tgz", ".img", f".img{delta_restore.BLOCK_SUFFIX}")]
+    results, elapsed = backup_verify.verify_all(BACKUP_ROOT)
+    if not backup_verify.report(results, elapsed, log=log, required=restore_inputs):
+        log("Backup set failed integrity check; refusing to restore from it")
+        sys.exit(2)
+
+def restore_vm(vm: str, host: str, delta: bool = False):
+    backup = os.path.join(BACKUP_ROOT, f"{vm}.img") if BACKUP_ROOT else ""
+    disk = os.path.join(VM_DISK_ROOT, f"{vm}.img") if VM_DISK_ROOT else ""
+    if not (delta and backup and disk and os.path.isfile(backup) and os.path.isfile(disk)):
+        log(f"Restoring VM {vm} to {host} from external-storage://backups/{vm}.tgz")
+        progress_bar(f"Restoring {vm}", 3)
+        log(f"VM restore complete: {vm}")
+        return
+    from . import delta_restore
+    log(f"Delta restoring VM {vm} on {host}: comparing {disk} with block manifest of {vm}.img")
+    st = delta_restore.delta_restore(backup, disk)
+    log(f"VM restore complete: {vm} | rewrote {st['changed']}/{st['blocks']} blocks "
+        f"({st['bytes_written'] // (1024 * 1024)}MB) in {st['seconds']:.2f}s")
+
+def post_checks_and_restore(delta: bool = False):
+    import random
+    log("PHASE: Post-checks and restore")
+    # Randomly simulate a host down
+    down_host = None
+    if random.randint(0,3) == 0:
+        down_host = ACTIVE_NODES[0]
+        log(f"ALERT: Detected compute host down: {down_host}")
+        log(f"Operator action: Re-installing platform on {down_host}")
+        time.sleep(2)
+        log(f"Platform re-installation complete on {down_host}")
+        for vm in NODE_VMS_LIST.get(down_host, []):
+            restore_vm(vm, down_host, delta)
+    else:
+        log("All compute hosts healthy")
+
+    # CRD-driven restore
+    crname = f"restore-system-{int(time.time())}"
+    create_vnfbackup_cr(crname, "system:restore")
+    monitor_cr_status(crname)
+    restore_pkg("BKUP.PKG")
+    restore_pkg("CRTE-FW.PKG")
+
+    # Post-sync
+    progress_bar("Syncing IDs across cloud DBs", 4)
+    log("Post-sync complete. BKUP-PKG DB and ports updated.")
+    log("CRTE-FW-PKG mappings validated and synchronized.")
+
+def final_summary():
+    log("PHASE: Summary")
+    lines = [
+        "\n+------------------------------+",
+        "| Backup and Restore Summary   |",
+        "+------------------------------+",
+        f"Total nodes evaluated : {len(RTRV_OUTPUT)}",
+        f"Active nodes now      : {ACTIVE_NODES}",
+        f"Standby nodes now     : {STANDBY_NODES}",
+        f"Backups stored at     : external-storage://backups/",
+        f"Key packages          : BKUP.PKG, CRTE-FW.PKG",
+        f"Checks performed      : RTRV-NODE-STS, VnfBackup CRD create/monitor, PV backup, package restore, ID sync",
+    ]
+    if "vnfctl.progress" in sys.modules:
+        lines.append(f"Progress overhead     : {sys.modules['vnfctl.progress'].MANAGER.overhead()}")
+    lines.append("+------------------------------+\n")
+    core._printer("\n".join(lines))
+    log("Backup and restore operation completed.")
@@ -0,0 +1,181 @@
+"""
+vnfctl/progress.py
+
+One progress renderer for every concurrent task in a run (per node, per VM, per DB...).
+
+- Tasks only bump counters; a single background thread renders at a capped rate
+  (REFRESH_HZ), so cost does not grow with the number of tasks or updates.
+- On a TTY: one block of bars (least complete first) plus an overall line with
+  per-unit totals and ETA, redrawn in place. log() lines clear it and are printed
+  above it; the bars come back on the next refresh.
+- Not a TTY (cron, CI, pipes): no bars; one "progress:" log line every LOG_INTERVAL seconds.
+- Time spent rendering is tracked so the overhead can be reported (overhead()).
+"""
+
+import os, sys, time, threading
+from typing import Dict, List, Optional
+
+from . import core
+
+REFRESH_HZ = 4
+LOG_INTERVAL = 15.0
+MAX_LINES = 8
+BAR_WIDTH = 24
+
+def _fmt_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 60}m{seconds % 60:02d}s" if seconds >= 60 else f"{seconds}s"
+
+class Task:
+    def __init__(self, manager: "ProgressManager", label: str, total: float, unit: str):
+        self.manager = manager
+        self.label = label
+        self.total = max(float(total), 1e-9)
+        self.unit = unit
+        self.n = 0.0
+        self.started = time.monotonic()
+
+    def advance(self, n: float = 1):
+        self.n = min(self.total, self.n + n)
+
+    def fraction(self) -> float:
+        return self.n / self.total
+
+    def close(self):
+        self.manager._finish(self)
+
+    def __enter__(self) -> "Task":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ProgressManager:
+    def __init__(self, stream=None, refresh_hz: float = REFRESH_HZ, log_interval: float = LOG_INTERVAL,
+                 tty: Optional[bool] = None):
+        self.stream = stream or sys.stdout
+        self.tty = self.stream.isatty() if tty is None else tty
+        if os.environ.get("TERM") == "dumb":
+            self.tty = False
+        self.interval = 1.0 / refresh_hz
+        self.log_interval = log_interval
+        self.lock = threading.RLock()
+        self.active: List[Task] = []
+        # per-unit [done, total] of finished tasks, for the overall line
+        self.finished: Dict[str, List[float]] = {}
+        self.finished_count = 0
+        self.first_start: Optional[float] = None
+        self.render_seconds = 0.0
+        self._drawn = 0
+        self._last_log = 0.0
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------ Tasks ------------------
+
+    def task(self, label: str, total: float, unit: str = "s") -> Task:
+        t = Task(self, label, total, unit)
+        with self.lock:
+            if self.first_start is None:
+                self.first_start = t.started
+                self._last_log = t.started
+            self.active.append(t)
+            if self._thread is None or not self._thread.is_alive():
+                core._printer = self.write
+                self._thread = threading.Thread(target=self._loop, name="vnfctl-progress", daemon=True)
+                self._thread.start()
+        return t
+
+    def _finish(self, task: Task):
+        with self.lock:
+            if task not in self.active:
+                return
+            self.active.remove(task)
+            done = self.finished.setdefault(task.unit, [0.0, 0.0])
+            done[0] += task.total
+            done[1] += task.total
+            self.finished_count += 1
+            if not self.active:
+                # clear now so plain print()s that follow a phase land on a clean screen
+                self._erase()
+                self.stream.flush()
+                self._wake.set()
+
+    # ------------------ Output ------------------
+
+    def write(self, line: str):
+        """Print a log line above the bar block; the render loop redraws the bars on its next tick."""
+        with self.lock:
+            start = time.perf_counter()
+            self._erase()
+            self.render_seconds += time.perf_counter() - start
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def _erase(self):
+        if self._drawn:
+            self.stream.write(f"\x1b[{self._drawn}F\x1b[J")
+            self._drawn = 0
+
+    def _overall(self) -> str:
+        totals: Dict[str, List[float]] = {u: list(v) for u, v in self.finished.items()}
+        for t in self.active:
+            acc = totals.setdefault(t.unit, [0.0, 0.0])
+            acc[0] += t.n
+            acc[1] += t.total
+        elapsed = time.monotonic() - (self.first_start or time.monotonic())
+        parts = []
+        for unit, (done, total) in sorted(totals.items()):
+            eta = (total - done) * elapsed / done if done else 0.0
+            parts.append(f"{done:.0f}/{total:.0f}{unit} ETA {_fmt_eta(eta)}")
+        return f"overall: {len(self.active)} active, {self.finished_count} done | " + " | ".join(parts)
+
+    def _draw(self):
+        if not self.tty or not self.active:
+            return
+        shown = sorted(self.active, key=lambda t: t.fraction())[:MAX_LINES]
+        lines = []
+        for t in shown:
+            fill = int(t.fraction() * BAR_WIDTH)
+            lines.append(f"{t.label[:36]:<36} |{'#' * fill}{' ' * (BAR_WIDTH - fill)}| {t.fraction() * 100:3.0f}%")
+        if len(self.active) > len(shown):
+            lines.append(f"... {len(self.active) - len(shown)} more")
+        lines.append(self._overall())
+        self.stream.write("\n".join(lines) + "\n")
+        self.stream.flush()
+        self._drawn = len(lines)
+
+    def _render(self):
+        start = time.perf_counter()
+        with self.lock:
+            if self.tty:
+                self._erase()
+                self._draw()
+            elif self.active and time.monotonic() - self._last_log >= self.log_interval:
+                self._last_log = time.monotonic()
+                busy = ", ".join(f"{t.label} {t.fraction() * 100:.0f}%" for t in self.active[:MAX_LINES])
+                self.stream.write(f"[{core.now_ts()}] progress: {self._overall()} ({busy})\n")
+                self.stream.flush()
+        self.render_seconds += time.perf_counter() - start
+
+    def _loop(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._render()
+            with self.lock:
+                if not self.active:
+                    self._erase()
+                    self.stream.flush()
+                    core._printer = core._write_line
+                    self._thread = None
+                    return
+
+    def overhead(self) -> str:
+        if self.first_start is None:
+            return "no progress tasks"
+        wall = time.monotonic() - self.first_start
+        pct = self.render_seconds / wall * 100 if wall > 0 else 0.0
+        return f"{self.render_seconds * 1000:.1f}ms rendering over {wall:.1f}s ({pct:.3f}%)"
+
+MANAGER = ProgressManager()
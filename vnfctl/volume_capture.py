@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+volume_capture.py
+
+Copy PVC images for the local-disk backend without pulling the bytes through Python.
+
+Strategy, first one that works wins:
+  1. reflink (FICLONE ioctl) - copy-on-write clone on btrfs/XFS, O(1) data movement
+  2. os.copy_file_range      - in-kernel copy, server-side on NFS 4.2 and friends
+  3. os.sendfile             - in-kernel copy on older kernels
+  4. readinto + reused buffer - plain userspace copy with a single preallocated buffer
+
+Usage
+- python3 -m vnfctl.volume_capture /var/lib/pvc/general-storage-pvc.img /srv/backups/general-storage-pvc.img
+"""
+
+import os, sys, time, errno
+from typing import Tuple
+
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+COPY_CHUNK = 1 << 30  # per-syscall cap for copy_file_range/sendfile
+BUFFER_SIZE = 8 * 1024 * 1024
+
+# errnos meaning "this fast path is not available here", not a real I/O failure
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF, errno.ETXTBSY}
+
+# ------------------ Copy strategies ------------------
+
+def _try_reflink(src_fd: int, dst_fd: int) -> bool:
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+def _copy_kernel(fn, src_fd: int, dst_fd: int, size: int) -> int:
+    copied = 0
+    while copied < size:
+        n = fn(src_fd, dst_fd, copied, min(COPY_CHUNK, size - copied))
+        if n == 0:
+            if copied == 0:
+                # some filesystems (FUSE, procfs-like) report 0 instead of an errno
+                raise OSError(errno.EOPNOTSUPP, f"{fn.__name__} copied nothing")
+            break
+        copied += n
+    return copied
+
+def _copy_file_range(src_fd, dst_fd, offset, count):
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+def _sendfile(src_fd, dst_fd, offset, count):
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+def _copy_readinto(src, dst) -> int:
+    buf = bytearray(BUFFER_SIZE)
+    view = memoryview(buf)
+    copied = 0
+    while True:
+        n = src.readinto(buf)
+        if not n:
+            break
+        written = 0
+        while written < n:  # unbuffered writes may be short
+            written += dst.write(view[written:n])
+        copied += n
+    return copied
+
+# ------------------ Public API ------------------
+
+def capture_volume(src_path: str, dst_path: str) -> Tuple[str, int, float]:
+    """Copy src_path to dst_path with the fastest available method. Returns (method, bytes, seconds)."""
+    start = time.perf_counter()
+    tmp = dst_path + ".tmp"
+    try:
+        with open(src_path, "rb", buffering=0) as src, open(tmp, "wb", buffering=0) as dst:
+            size = os.fstat(src.fileno()).st_size
+            sfd, dfd = src.fileno(), dst.fileno()
+            method, copied = "", 0
+            if _try_reflink(sfd, dfd):
+                method, copied = "reflink", size
+            for name, fn in (("copy_file_range", _copy_file_range), ("sendfile", _sendfile)):
+                if method or not hasattr(os, name):
+                    continue
+                try:
+                    copied = _copy_kernel(fn, sfd, dfd, size)
+                    method = name
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED:
+                        raise
+                    # discard any partial output and let the next method start from offset 0
+                    os.ftruncate(dfd, 0)
+            if not method:
+                src.seek(0)
+                dst.seek(0)
+                method, copied = "readinto", _copy_readinto(src, dst)
+            if copied != size:
+                raise IOError(f"short copy of {src_path}: {copied}/{size} bytes")
+            os.fsync(dfd)
+        os.replace(tmp, dst_path)
+    except BaseException:
+        # never leave a partial copy behind: list_artifacts() hides *.tmp, so it would go unnoticed
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return method, copied, time.perf_counter() - start
+
+def main():
+    if len(sys.argv) != 3:
+        print(f"usage: {sys.argv[0]} SRC DST")
+        sys.exit(2)
+    method, copied, elapsed = capture_volume(sys.argv[1], sys.argv[2])
+    rate = (copied / 1e6) / elapsed if elapsed > 0 else 0.0
+    print(f"Captured {copied / 1e6:.1f}MB via {method} in {elapsed:.2f}s ({rate:.0f} MB/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+vnfctl/whatif.py
+
+Monte Carlo RTO/RPO estimator for compute-host failures, vectorised with NumPy.
+
+Instead of one random host failure per run (post_checks_and_restore()), simulate
+--trials failures of *every* node using the inventory (NODE_VMS_LIST, VM_SIZE_LIST):
+
+- RTO = detection + platform re-install + restore makespan of the node's VMs over
+  --parallelism restore streams (longest-first assignment to the least loaded stream).
+- RPO = for the node's worst VM, time between its last completed backup and the failure.
+  Backups start once per --interval, nodes in backup order (standby first, then the
+  former actives), VMs back to back; the failure lands uniformly inside the interval.
+  A cycle longer than --interval overlaps the next one; RPO counts from the newest
+  copy any cycle has completed.
+- Throughputs and re-install time carry log-normal jitter (--jitter).
+
+All scenarios are evaluated as (nodes, trials, vms) arrays; no per-trial Python loop.
+
+Usage
+- python3 -m vnfctl whatif
+- python3 -m vnfctl whatif --trials 500000 --parallelism 1,2,4 --restore-mbps 150
+"""
+
+import time, argparse
+from typing import List, Dict, Optional
+
+from .core import RTRV_OUTPUT, NODE_VMS_LIST, VM_SIZE_LIST, log
+
+PERCENTILES = (50, 90, 99)
+
+def _fmt(seconds: float) -> str:
+    sign, seconds = ("-" if seconds < 0 else ""), abs(int(round(seconds)))
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    return sign + (f"{h}h{m:02d}m" if h else f"{m}m{s:02d}s")
+
+def backup_order() -> List[str]:
+    standby = [n for n, s in RTRV_OUTPUT if s != "ACTIVE"]
+    active = [n for n, s in RTRV_OUTPUT if s == "ACTIVE"]
+    return standby + active
+
+def simulate(trials: int = 200000, parallelism: int = 2, backup_mbps: float = 50.0, restore_mbps: float = 100.0,
+             per_vm_overhead: float = 2.0, detect: float = 60.0, reinstall: float = 1200.0,
+             interval: float = 86400.0, jitter: float = 0.25, seed: Optional[int] = None) -> Dict[str, Dict]:
+    """Return {node: {"rto": [p50, p90, p99], "rpo": [...]}} in seconds."""
+    if trials < 1 or parallelism < 1:
+        raise ValueError(f"trials and parallelism must be >= 1, got {trials} and {parallelism}")
+    if min(backup_mbps, restore_mbps, interval) <= 0:
+        raise ValueError(f"backup_mbps, restore_mbps and interval must be > 0, "
+                         f"got {backup_mbps}, {restore_mbps} and {interval}")
+    if min(per_vm_overhead, detect, reinstall, jitter) < 0:
+        raise ValueError(f"per_vm_overhead, detect, reinstall and jitter must be >= 0, "
+                         f"got {per_vm_overhead}, {detect}, {reinstall} and {jitter}")
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    nodes = backup_order()
+    vms = [vm for n in nodes for vm in NODE_VMS_LIST.get(n, [])]
+    sizes = np.array([VM_SIZE_LIST.get(vm, 300) for vm in vms], dtype=np.float64)
+    owner = np.array([nodes.index(n) for n in nodes for _ in NODE_VMS_LIST.get(n, [])])
+    n_nodes, n_vms = len(nodes), len(vms)
+    width = max((len(NODE_VMS_LIST.get(n, [])) for n in nodes), default=0)
+
+    def noisy(shape):
+        # median-1 log-normal multiplier
+        return rng.lognormal(0.0, jitter, size=shape) if jitter > 0 else np.ones(shape)
+
+    # --- RPO: one backup cycle per trial, VMs completing back to back in backup order ---
+    backup_t = sizes / backup_mbps * noisy((trials, n_vms)) + per_vm_overhead       # (trials, vms)
+    done_at = np.cumsum(backup_t, axis=1)                                           # completion offsets
+    fail_at = rng.uniform(0.0, interval, size=(trials, 1))
+    # cycle k completes a VM at k * interval + done_at; the newest copy is the largest such time
+    # <= fail_at. That also covers cycles that outlast --interval and overlap the next one.
+    loss = np.mod(fail_at - done_at, interval)
+    # node -> its VM columns, padded with a sentinel column of -inf
+    cols = np.full((n_nodes, width), n_vms)
+    for i, n in enumerate(nodes):
+        cols[i, :len(NODE_VMS_LIST.get(n, []))] = np.flatnonzero(owner == i)
+    loss = np.concatenate([loss, np.full((trials, 1), -np.inf)], axis=1)
+    rpo = loss[:, cols].max(axis=2).T if width else np.zeros((n_nodes, trials))    # worst VM per node
+    rpo = np.where(np.isfinite(rpo), rpo, 0.0)
+
+    # --- RTO: restore makespan over `parallelism` streams, padded to (nodes, trials, width) ---
+    padded = np.concatenate([sizes, [0.0]])[cols]                                   # (nodes, width) sizes
+    restore_t = np.where(padded[:, None, :] > 0,
+                         padded[:, None, :] / restore_mbps * noisy((n_nodes, trials, width)) + per_vm_overhead, 0.0)
+    restore_t = -np.sort(-restore_t, axis=2)                                        # longest first
+    loads = np.zeros((n_nodes, trials, parallelism))
+    for j in range(width):
+        k = loads.argmin(axis=2)[..., None]
+        np.put_along_axis(loads, k, np.take_along_axis(loads, k, axis=2) + restore_t[..., j:j + 1], axis=2)
+    rto = detect + reinstall * noisy((n_nodes, trials)) + loads.max(axis=2)
+
+    rto_p = np.percentile(rto, PERCENTILES, axis=1)
+    rpo_p = np.percentile(rpo, PERCENTILES, axis=1)
+    return {n: {"rto": rto_p[:, i].tolist(), "rpo": rpo_p[:, i].tolist()} for i, n in enumerate(nodes)}
+
+# ------------------ CLI ------------------
+
+def _positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return value
+
+def _positive_float(text: str) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}")
+    if not 0 < value < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be > 0 and finite, got {value}")
+    return value
+
+def _non_negative_float(text: str) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}")
+    if not 0 <= value < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be >= 0 and finite, got {value}")
+    return value
+
+def _positive_ints(text: str) -> List[int]:
+    levels = [_positive_int(x.strip()) for x in text.split(",") if x.strip()]
+    if not levels:
+        raise argparse.ArgumentTypeError("expected at least one stream count")
+    return levels
+
+def add_arguments(p: argparse.ArgumentParser):
+    p.add_argument("--trials", type=_positive_int, default=200000, help="Failure scenarios per node")
+    p.add_argument("--parallelism", type=_positive_ints, default="1,2,4",
+                   help="Comma-separated restore stream counts to compare")
+    p.add_argument("--backup-mbps", type=_positive_float, default=50.0, help="Backup throughput per VM (MB/s)")
+    p.add_argument("--restore-mbps", type=_positive_float, default=100.0, help="Restore throughput per stream (MB/s)")
+    p.add_argument("--per-vm-overhead", type=_non_negative_float, default=2.0, help="Fixed seconds per VM backup/restore")
+    p.add_argument("--detect", type=_non_negative_float, default=60.0, help="Seconds to detect the host failure")
+    p.add_argument("--reinstall", type=_non_negative_float, default=1200.0, help="Median platform re-install seconds")
+    p.add_argument("--interval", type=_positive_float, default=86400.0, help="Seconds between backup cycles")
+    p.add_argument("--jitter", type=_non_negative_float, default=0.25, help="Log-normal sigma on throughputs and re-install")
+    p.add_argument("--seed", type=int, help="RNG seed for reproducible runs")
+
+def run(args) -> int:
+    levels = args.parallelism
+    log(f"What-if: {args.trials} host-failure scenarios per node, restore parallelism {levels}")
+    header = " | ".join(f"RTO p{p:<3}" for p in PERCENTILES) + " | " + " | ".join(f"RPO p{p:<3}" for p in PERCENTILES)
+    for par in levels:
+        start = time.perf_counter()
+        res = simulate(args.trials, par, args.backup_mbps, args.restore_mbps, args.per_vm_overhead,
+                       args.detect, args.reinstall, args.interval, args.jitter, args.seed)
+        elapsed = time.perf_counter() - start
+        print(f"\nRestore parallelism {par} ({args.trials * len(res)} scenarios in {elapsed:.2f}s)")
+        print(f"{'NODE':<15} | {header}")
+        print(f"{'-'*15}-+-{'-' * len(header)}")
+        for node, r in res.items():
+            cells = [f"{_fmt(v):<8}" for v in r["rto"] + r["rpo"]]
+            print(f"{node:<15} | " + " | ".join(cells))
+    print("")
+    return 0
+
+def main():
+    p = argparse.ArgumentParser(description="Monte Carlo RTO/RPO estimator for host failures.")
+    add_arguments(p)
+    raise SystemExit(run(p.parse_args()))
+
+if __name__ == "__main__":
+    main()